@@ -1,17 +1,34 @@
 import os
+import re
+import importlib.util
 import random
 import secrets
 import asyncio
-import nest_asyncio
+import heapq
+import time
+from collections import OrderedDict
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     ApplicationBuilder, CommandHandler, CallbackQueryHandler,
-    ContextTypes, Defaults
+    ContextTypes, Defaults, AIORateLimiter
 )
 import logging
 import httpx
 
-nest_asyncio.apply()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiolimiter
+except ImportError:
+    aiolimiter = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Logging
 logging.basicConfig(
@@ -43,118 +60,210 @@ MONEY_BANK = "\U0001F3E6"
 BLUE_CIRCLE = "\U0001F535"
 ORANGE_CIRCLE = "\U0001F7E0"
 
+# Characters Telegram MarkdownV2 reserves outside entities
+_MD2_ESCAPE = "_*[]()~`>#+-=|{}.!\\"
+_MD2_TABLE = str.maketrans({c: f"\\{c}" for c in _MD2_ESCAPE})
+
 def escape_markdown_v2(text):
-    escape_chars = r"_*[]()~`>#+-=|{}.!\\"
-    for c in escape_chars:
-        text = text.replace(c, f"\\{c}")
-    return text
+    return text.translate(_MD2_TABLE)
+
+# cc|mm|yy|cvv as accepted by /chk, /mchk and /auth
+_CARD_RE = re.compile(r"\d{13,19}\|\d{2}\|\d{2}\|\d{3,4}", re.ASCII)
+
+# BIN lookup cache lifetimes (seconds); failed lookups are retried sooner
+BIN_CACHE_TTL = 24 * 3600
+BIN_NEGATIVE_TTL = 300
+BIN_CACHE_SIZE = 4096
+
+# Oldest unanswered /auth sessions are dropped beyond this many
+PENDING_AUTH_LIMIT = 1000
+
+# Simulated gateway latency range (seconds) per checked card; None disables it
+MOCK_AUTH_DELAY = (0.2, 0.5)
 
 # Env
 ADMIN_ID = os.getenv("ADMIN_ID")
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 GROUP_CHAT_ID = os.getenv("GROUP_CHAT_ID")
 
-if not BOT_TOKEN or not ADMIN_ID or not GROUP_CHAT_ID:
-    missing = []
-    if not BOT_TOKEN:
-        missing.append("BOT_TOKEN")
-    if not ADMIN_ID:
-        missing.append("ADMIN_ID")
-    if not GROUP_CHAT_ID:
-        missing.append("GROUP_CHAT_ID")
+missing = [
+    name for name, value in (
+        ("BOT_TOKEN", BOT_TOKEN), ("ADMIN_ID", ADMIN_ID), ("GROUP_CHAT_ID", GROUP_CHAT_ID)
+    ) if not value
+]
+if missing:
     logger.error(f"Missing environment variables: {', '.join(missing)}. Please set them and restart.")
     exit(1)
 
-def card_brand_type(cc):
-    cc = str(cc)
+try:
+    GROUP_CHAT_ID = int(GROUP_CHAT_ID)
+except ValueError:
+    logger.error(f"GROUP_CHAT_ID must be a numeric chat id, got {GROUP_CHAT_ID!r}. Please fix it and restart.")
+    exit(1)
+
+# SWAR Luhn: the payload is left-padded to 16 ASCII digits and handled as one
+# 128-bit integer with a digit per byte lane, so the lane parity is fixed.
+_LUHN_ZERO = int.from_bytes(b"0" * 16, "big")
+_LUHN_PLAIN = 0x000F000F000F000F000F000F000F000F
+_LUHN_DOUBLE = 0x0F000F000F000F000F000F000F000F00
+_LUHN_SIX = 0x06060606060606060606060606060606
+_LUHN_ONES = 0x01010101010101010101010101010101
+# ASCII digit -> ASCII digit of its Luhn-doubled value
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", b"0246813579")
+
+def _luhn_sum(buf: bytes) -> int:
+    if len(buf) > 16:
+        # Too wide for the lanes: sum plain digits and table-doubled digits
+        doubled = buf[-2::-2].translate(_LUHN_DOUBLED)
+        return sum(buf[-1::-2]) + sum(doubled) - 48 * len(buf)
+    n = int.from_bytes(buf.rjust(16, b"0"), "big") - _LUHN_ZERO
+    doubled = (n & _LUHN_DOUBLE) << 1
+    doubled -= (((doubled + _LUHN_SIX) >> 4) & _LUHN_ONES) * 9
+    acc = (n & _LUHN_PLAIN) + doubled
+    return ((acc * _LUHN_ONES) >> 120) & 0xFF
+
+BRAND_TABLE = (
+    (EMOJIS['visa'], "VISA"),
+    (EMOJIS['mastercard'], "MASTERCARD"),
+    (EMOJIS['amex'], "AMEX"),
+    (EMOJIS['discover'], "DISCOVER"),
+    (EMOJIS['diners'], "DINERS"),
+    (EMOJIS['jcb'], "JCB"),
+    (EMOJIS['unionpay'], "UNIONPAY"),
+    (EMOJIS['mir'], "MIR"),
+    (EMOJIS['unknown'], "UNKNOWN"),
+)
+(BRAND_VISA, BRAND_MASTERCARD, BRAND_AMEX, BRAND_DISCOVER, BRAND_DINERS,
+ BRAND_JCB, BRAND_UNIONPAY, BRAND_MIR, BRAND_UNKNOWN) = range(len(BRAND_TABLE))
+
+def _card_brand_rule(cc):
     if cc.startswith("4"):
-        return EMOJIS['visa'], "VISA"
+        return BRAND_VISA
     if cc.startswith(("51", "52", "53", "54", "55")) or (2221 <= int(cc[:4]) <= 2720):
-        return EMOJIS['mastercard'], "MASTERCARD"
+        return BRAND_MASTERCARD
     if cc.startswith(("34", "37")):
-        return EMOJIS['amex'], "AMEX"
+        return BRAND_AMEX
     if cc.startswith("6"):
-        return EMOJIS['discover'], "DISCOVER"
+        return BRAND_DISCOVER
     if cc.startswith(("300", "301", "302", "303", "304", "305", "36", "38", "39")):
-        return EMOJIS['diners'], "DINERS"
+        return BRAND_DINERS
     if cc.startswith("35"):
-        return EMOJIS['jcb'], "JCB"
+        return BRAND_JCB
     if cc.startswith("62"):
-        return EMOJIS['unionpay'], "UNIONPAY"
+        return BRAND_UNIONPAY
     if cc.startswith("220"):
-        return EMOJIS['mir'], "MIR"
-    return EMOJIS['unknown'], "UNKNOWN"
+        return BRAND_MIR
+    return BRAND_UNKNOWN
+
+# Every 1- to 4-digit prefix resolved once at import; card_brand_type is
+# then a single dict lookup for any all-digit input.
+_BRAND_PREFIX = {
+    f"{p:0{width}d}": BRAND_TABLE[_card_brand_rule(f"{p:0{width}d}")]
+    for width in range(1, 5)
+    for p in range(10 ** width)
+}
+
+def card_brand_type(cc):
+    cc = str(cc)
+    brand = _BRAND_PREFIX.get(cc[:4])
+    if brand is None:
+        brand = BRAND_TABLE[_card_brand_rule(cc)]
+    return brand
+
+# (prefix, length, brand id) choices for random card generation
+_GEN_PREFIXES = (
+    ("4", 16, BRAND_VISA),
+    ("51", 16, BRAND_MASTERCARD), ("52", 16, BRAND_MASTERCARD), ("53", 16, BRAND_MASTERCARD),
+    ("54", 16, BRAND_MASTERCARD), ("55", 16, BRAND_MASTERCARD),
+    ("2221", 16, BRAND_MASTERCARD), ("2720", 16, BRAND_MASTERCARD),
+    ("34", 15, BRAND_AMEX), ("37", 15, BRAND_AMEX),
+    ("6011", 16, BRAND_DISCOVER), ("65", 16, BRAND_DISCOVER),
+    ("35", 16, BRAND_JCB),
+    ("62", 16, BRAND_UNIONPAY),
+)
+
+# Every "mm|yy" a generated card can carry
+_EXPIRIES = tuple(f"{m:02d}|{y}" for m in range(1, 13) for y in range(24, 31))
+
+def _random_digits(n):
+    # n uniform decimal digits from a single CSPRNG draw
+    if n <= 0:
+        return ""
+    return f"{secrets.randbelow(10 ** n):0{n}d}"
+
+class ReplyRateLimiter(AIORateLimiter):
+    # Deletes are not sends, so they skip the per-group message budget
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        if endpoint == "deleteMessage":
+            return await callback(*args, **kwargs)
+        return await super().process_request(callback, args, kwargs, endpoint, data, rate_limit_args)
 
 class TelegramCCCheckerBot:
     def __init__(self):
         self.is_logged_in = set()
-        self.pending_auth = {}
+        self.pending_auth = OrderedDict()
+        self._http = httpx.AsyncClient(
+            timeout=5,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+        self._bin_cache = OrderedDict()
+        self._bin_inflight = {}
+        # Pending auto-deletes as (delete_at, chat_id, message_id)
+        self._delqueue = []
+        self._wakeup = asyncio.Event()
+        self._sweeper = None
+        # (emoji, label, check(cc, digit_sum)) rows rendered by full_auth_check, in report order
+        self._auth_checks = (
+            (CHECKMARK, "BASIC", lambda cc, s: self.mock_basic_auth(cc)),
+            (SHIELD, "3DS B3", lambda cc, s: self.mock_b3_auth(s)),
+            (BLUE_CIRCLE, "Stripe", lambda cc, s: self.mock_stripe_auth(cc)),
+            (ORANGE_CIRCLE, "PayPal", lambda cc, s: self.mock_paypal_auth()),
+            (MONEY_BANK, "Bank", lambda cc, s: self.mock_bank_auth(s)),
+        )
 
     def is_authorized_group(self, chat_id):
-        return str(chat_id) == str(GROUP_CHAT_ID)
+        return chat_id == GROUP_CHAT_ID
 
     def random_cc_bin_and_length(self):
-        brands = [
-            ("4", 16, 'visa'),
-            ("51", 16, 'mastercard'), ("52", 16, 'mastercard'), ("53", 16, 'mastercard'),
-            ("54", 16, 'mastercard'), ("55", 16, 'mastercard'),
-            ("2221", 16, 'mastercard'), ("2720", 16, 'mastercard'),
-            ("34", 15, 'amex'), ("37", 15, 'amex'),
-            ("6011", 16, 'discover'), ("65", 16, 'discover'),
-            ("35", 16, 'jcb'),
-            ("62", 16, 'unionpay'),
-        ]
-        prefix, length, brand = random.choice(brands)
-        if len(prefix) < 6:
-            prefix += ''.join(secrets.choice("0123456789") for _ in range(6 - len(prefix)))
+        prefix, length, brand = random.choice(_GEN_PREFIXES)
+        prefix += _random_digits(6 - len(prefix))
         return (prefix, length, brand)
 
-    def random_cc_as_string(self):
-        bin6, length, brand = self.random_cc_bin_and_length()
-        cc_list = [int(d) for d in bin6]
-        while len(cc_list) < (length - 1):
-            cc_list.append(secrets.randbelow(10))
-        checksum = self.luhn_checksum(cc_list)
-        cc_list.append(checksum)
-        cc_number = "".join(str(x) for x in cc_list)
-        cvv_len = 4 if brand == 'amex' else 3
-        exp_month = f"{random.randint(1, 12):02d}"
-        exp_year = f"{random.randint(24, 30)}"
-        cvv = "".join(str(random.randint(0,9)) for _ in range(cvv_len))
-        return f"{cc_number}|{exp_month}|{exp_year}|{cvv}"
-
-    def random_bin_cc(self, bin6):
+    def random_cc_batch(self, count):
+        specs = []
+        for _ in range(count):
+            bin6, length, brand = self.random_cc_bin_and_length()
+            specs.append((bin6, length, 4 if brand == BRAND_AMEX else 3))
+        return self._build_cards(specs)
+
+    def random_bin_cc_batch(self, bin6, count):
         bin6 = str(bin6)[:6]
         while len(bin6) < 6:
             bin6 += "0"
         length = 15 if bin6.startswith(("34", "37")) else 16
-        cc_list = list(map(int, bin6))
-        while len(cc_list) < (length - 1):
-            cc_list.append(random.randint(0, 9))
-        checksum = self.luhn_checksum(cc_list)
-        cc_list.append(checksum)
-        cc_number = "".join(str(x) for x in cc_list)
         cvv_len = 4 if bin6.startswith(("34", "37")) else 3
-        exp_month = f"{random.randint(1, 12):02d}"
-        exp_year = f"{random.randint(24, 30)}"
-        cvv = "".join(str(random.randint(0,9)) for _ in range(cvv_len))
-        return f"{cc_number}|{exp_month}|{exp_year}|{cvv}"
-
-    def luhn_checksum(self, digits):
-        digits = digits[:]
-        digits.reverse()
-        total = 0
-        for i, d in enumerate(digits):
-            if i % 2 == 0:
-                total += d
-            else:
-                dd = d * 2
-                if dd > 9:
-                    dd -= 9
-                total += dd
-        return (10 - (total % 10)) % 10
+        return self._build_cards([(bin6, length, cvv_len)] * count)
+
+    def _build_cards(self, specs):
+        # One RNG draw covers the random body and CVV digits of the whole batch
+        digits = _random_digits(sum(length - 1 - len(bin6) + cvv_len for bin6, length, cvv_len in specs))
+        cards = []
+        pos = 0
+        for bin6, length, cvv_len in specs:
+            end = pos + length - 1 - len(bin6)
+            payload = bin6 + digits[pos:end]
+            pos = end + cvv_len
+            cards.append(
+                f"{payload}{self.luhn_checksum(payload.encode())}"
+                f"|{random.choice(_EXPIRIES)}|{digits[end:pos]}"
+            )
+        return cards
+
+    def luhn_checksum(self, payload):
+        return -_luhn_sum(payload) % 10
 
-    # NEW: /gen sends each cc in a separate message (box), with brand+emoji, no username.
+    # /gen sends all generated cc in one message, a box per line with brand+emoji, no username.
     async def gen(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not self.is_authorized_group(update.effective_chat.id):
             await update.message.reply_text(f"{CROSSMARK} Access denied. Please use this bot only in the authorized group.")
@@ -178,16 +287,18 @@ class TelegramCCCheckerBot:
                 count = min(int(args[1]), 20)
 
         if not bin_mode:
-            cards = [self.random_cc_as_string() for _ in range(count)]
+            cards = self.random_cc_batch(count)
         else:
-            cards = [self.random_bin_cc(bin_given) for _ in range(count)]
+            cards = self.random_bin_cc_batch(bin_given, count)
+        if not cards:
+            return
 
-        for card in cards:
-            ccn = card.split("|")[0]
-            emoji, brand = card_brand_type(ccn)
-            response = f"`{escape_markdown_v2(card)}` | {emoji}"
-            msg = await update.message.reply_text(response, parse_mode="MarkdownV2")
-            asyncio.create_task(self.autodel_message(context, msg, 300))
+        response = "\n".join(
+            f"`{escape_markdown_v2(card)}` | {card_brand_type(card.partition('|')[0])[0]}"
+            for card in cards
+        )
+        msg = await update.message.reply_text(response, parse_mode="MarkdownV2")
+        self.autodel_message(msg, 300)
 
     # /chk for single card
     async def chk(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -204,8 +315,7 @@ class TelegramCCCheckerBot:
             await update.message.reply_text(f"{WARNING} Usage: /chk cc|mm|yy|cvv", parse_mode="MarkdownV2")
             return
         card_str = args[0].strip()
-        card_data = card_str.split("|")
-        if len(card_data) != 4:
+        if not _CARD_RE.fullmatch(card_str):
             await update.message.reply_text(f"{CROSSMARK} Invalid card format: '{escape_markdown_v2(card_str)}' (must be cc|mm|yy|cvv)", parse_mode="MarkdownV2")
             return
 
@@ -216,7 +326,7 @@ class TelegramCCCheckerBot:
             f"Checked by: {username}"
         )
         msg = await update.message.reply_text(txt, parse_mode="MarkdownV2")
-        asyncio.create_task(self.autodel_message(context, msg, 300))
+        self.autodel_message(msg, 300)
 
     # /mchk for batch cards (up to 20), blank lines between blocks
     async def mchk(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -230,7 +340,7 @@ class TelegramCCCheckerBot:
 
         full_text = update.message.text
         lines = [line.strip() for line in full_text.split('\n') if line.strip() and not line.strip().startswith('/mchk')]
-        valid_cards = [line for line in lines if len(line.split('|')) == 4]
+        valid_cards = [line for line in lines if _CARD_RE.fullmatch(line)]
 
         if not valid_cards:
             await update.message.reply_text(f"{WARNING} Paste up to 20 cc|mm|yy|cvv, each on a new line after /mchk", parse_mode="MarkdownV2")
@@ -238,47 +348,77 @@ class TelegramCCCheckerBot:
 
         valid_cards = valid_cards[:20]
         top_bin = valid_cards[0][:6]
-        bin_info_msg = await self.get_bin_info_message(top_bin)
+        bin_task = asyncio.create_task(self.get_bin_info_message(top_bin))
 
+        results = await asyncio.gather(
+            *(self.full_auth_check(card_str, get_brand=True) for card_str in valid_cards)
+        )
         result_lines = []
-        for cidx, card_str in enumerate(valid_cards):
-            res, emoji, _ = await self.full_auth_check(card_str, get_brand=True)
+        for card_str, (res, emoji, _) in zip(valid_cards, results):
             report = (
                 f"`{escape_markdown_v2(card_str)}` | {emoji}\n"
                 f"{escape_markdown_v2(res)}\n"
                 f"Checked by: {username}"
             )
             result_lines.append(report)
+        bin_info_msg = await bin_task
         final_response = (f"{bin_info_msg}\n" if bin_info_msg else "") + "\n\n".join(result_lines)
         final_response = final_response[:4000]
         msg = await update.message.reply_text(final_response, parse_mode="MarkdownV2")
-        asyncio.create_task(self.autodel_message(context, msg, 300))
+        self.autodel_message(msg, 300)
 
     async def get_bin_info_message(self, bin_number):
+        cached = self._bin_cache.get(bin_number)
+        if cached and cached[0] > time.monotonic():
+            self._bin_cache.move_to_end(bin_number)
+            return cached[1]
+        # Concurrent misses for the same BIN share one lookup task; shielding
+        # it keeps a cancelled caller from cancelling the others' lookup
+        task = self._bin_inflight.get(bin_number)
+        if task is None:
+            task = asyncio.create_task(self._lookup_bin_info_message(bin_number))
+            self._bin_inflight[bin_number] = task
+            task.add_done_callback(lambda _: self._bin_inflight.pop(bin_number, None))
+        return await asyncio.shield(task)
+
+    async def _lookup_bin_info_message(self, bin_number):
+        msg = await self._fetch_bin_info_message(bin_number)
+        ttl = BIN_CACHE_TTL if msg else BIN_NEGATIVE_TTL
+        self._bin_cache[bin_number] = (time.monotonic() + ttl, msg)
+        self._bin_cache.move_to_end(bin_number)
+        if len(self._bin_cache) > BIN_CACHE_SIZE:
+            self._bin_cache.popitem(last=False)
+        return msg
+
+    async def _fetch_bin_info_message(self, bin_number):
         url = f"https://lookup.binlist.net/{bin_number}"
         try:
-            async with httpx.AsyncClient() as client:
-                r = await client.get(url, timeout=5)
-                if r.status_code == 200:
-                    d = r.json()
-                    brand = d.get("scheme", "UNKNOWN").upper()
-                    typex = d.get("type", "UNKNOWN").upper()
-                    category = d.get("brand", "UNKNOWN")
-                    bankn = d.get("bank", {}).get("name", "UNKNOWN")
-                    country = d.get("country", {}).get("name", "")
-                    emoji_flag = d.get("country", {}).get("emoji", "")
-                    return (
-                        f"𝗕𝗜𝗡 ⇾ `{escape_markdown_v2(bin_number)}`\n"
-                        f"𝗜𝗻𝗳𝗼: {escape_markdown_v2(brand)} - {escape_markdown_v2(typex)} - {escape_markdown_v2(str(category))}\n"
-                        f"𝗕𝗮𝗻𝗸: {escape_markdown_v2(str(bankn))}\n"
-                        f"𝗖𝗼𝘂𝗻𝘁𝗿𝘆: {escape_markdown_v2(str(country))} {escape_markdown_v2(str(emoji_flag))}\n"
-                    )
-                else:
-                    return ""
+            r = await self._http.get(url)
+            if r.status_code == 200:
+                d = orjson.loads(r.content) if orjson is not None else r.json()
+                brand = d.get("scheme", "UNKNOWN").upper()
+                typex = d.get("type", "UNKNOWN").upper()
+                category = d.get("brand", "UNKNOWN")
+                bankn = d.get("bank", {}).get("name", "UNKNOWN")
+                country = d.get("country", {}).get("name", "")
+                emoji_flag = d.get("country", {}).get("emoji", "")
+                return (
+                    f"𝗕𝗜𝗡 ⇾ `{escape_markdown_v2(bin_number)}`\n"
+                    f"𝗜𝗻𝗳𝗼: {escape_markdown_v2(brand)} - {escape_markdown_v2(typex)} - {escape_markdown_v2(str(category))}\n"
+                    f"𝗕𝗮𝗻𝗸: {escape_markdown_v2(str(bankn))}\n"
+                    f"𝗖𝗼𝘂𝗻𝘁𝗿𝘆: {escape_markdown_v2(str(country))} {escape_markdown_v2(str(emoji_flag))}\n"
+                )
+            else:
+                return ""
         except Exception as e:
             logger.debug(f"BIN info fetch failed: {e}")
             return ""
 
+    async def aclose(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        await self._http.aclose()
+
     async def auth(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not self.is_authorized_group(update.effective_chat.id):
             await update.message.reply_text(f"{CROSSMARK} Access denied. Please use this bot only in the authorized group.")
@@ -287,18 +427,21 @@ class TelegramCCCheckerBot:
             await update.message.reply_text(f"{WARNING} Usage: /auth cc|mm|yy|cvv")
             return
         card_str = context.args[0]
-        card_data = card_str.split("|")
-        if len(card_data) != 4:
+        if not _CARD_RE.fullmatch(card_str):
             await update.message.reply_text(f"{CROSSMARK} Invalid card format: '{card_str}' (must be cc|mm|yy|cvv)")
             return
 
-        self.pending_auth[update.effective_user.id] = card_str
+        user_id = update.effective_user.id
+        self.pending_auth[user_id] = card_str
+        self.pending_auth.move_to_end(user_id)
+        if len(self.pending_auth) > PENDING_AUTH_LIMIT:
+            self.pending_auth.popitem(last=False)
         keyboard = [
             [InlineKeyboardButton("Check All Auths", callback_data="check_all_auths")]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         await update.message.reply_text(
-            f"{STAR} Press the button below to check all auth types for card ending {card_data[0][-4:]}",
+            f"{STAR} Press the button below to check all auth types for card ending {card_str.partition('|')[0][-4:]}",
             reply_markup=reply_markup
         )
 
@@ -317,100 +460,74 @@ class TelegramCCCheckerBot:
             else:
                 username = escape_markdown_v2(query.from_user.first_name)
             footer = f"\nChecked by: {username}\n{'-'*31}"
-            response = f"*{STAR} All Auth Results for Card {escape_markdown_v2(card_str.split('|')[0][-4:])} | {cc_brand_emoji}*\n{escape_markdown_v2(results)}{footer}"
+            response = f"*{STAR} All Auth Results for Card {escape_markdown_v2(card_str.partition('|')[0][-4:])} | {cc_brand_emoji}*\n{escape_markdown_v2(results)}{footer}"
             await query.edit_message_text(response, parse_mode="MarkdownV2")
-            del self.pending_auth[user_id]
+            self.pending_auth.pop(user_id, None)
 
     async def full_auth_check(self, card_str, get_brand=False):
-        card_data = card_str.split("|")
-        cc = card_data[0]
-        results = await asyncio.gather(
-            self.async_basic_check(card_str),
-            self.async_b3_auth(card_str),
-            self.async_stripe_auth(card_str),
-            self.async_paypal_auth(card_str),
-            self.async_bank_auth(card_str),
-        )
-        report = "\n".join(results)
+        cc = card_str.partition("|")[0]
+        last4 = cc[-4:]
+        # Callers validate with _CARD_RE, so the PAN is ASCII digits
+        digit_sum = sum(cc.encode()) - 48 * len(cc)
+        # One simulated gateway delay per card; the mocks themselves are instant
+        if MOCK_AUTH_DELAY:
+            await asyncio.sleep(random.uniform(*MOCK_AUTH_DELAY))
+        lines = []
+        for emoji, label, check in self._auth_checks:
+            result, msg = check(cc, digit_sum)
+            lines.append(f"{emoji} [{label}] Card {last4}: {result} - {msg}")
+        report = "\n".join(lines)
         if get_brand:
             emoji, brand = card_brand_type(cc)
             return report, emoji, brand
         return report
 
-    async def async_basic_check(self, card_str):
-        cc = card_str.split("|")[0]
-        await asyncio.sleep(random.uniform(0.2, 0.5))
-        result, msg = self.mock_basic_auth(cc)
-        return f"{CHECKMARK} [BASIC] Card {cc[-4:]}: {result} - {msg}"
-
-    async def async_b3_auth(self, card_str):
-        cc = card_str.split("|")[0]
-        await asyncio.sleep(random.uniform(0.2, 0.5))
-        result, msg = self.mock_b3_auth(cc)
-        return f"{SHIELD} [3DS B3] Card {cc[-4:]}: {result} - {msg}"
-
-    async def async_stripe_auth(self, card_str):
-        cc = card_str.split("|")[0]
-        await asyncio.sleep(random.uniform(0.2, 0.5))
-        result, msg = self.mock_stripe_auth(cc)
-        return f"{BLUE_CIRCLE} [Stripe] Card {cc[-4:]}: {result} - {msg}"
-
-    async def async_paypal_auth(self, card_str):
-        cc = card_str.split("|")[0]
-        await asyncio.sleep(random.uniform(0.2, 0.5))
-        result, msg = self.mock_paypal_auth(cc)
-        return f"{ORANGE_CIRCLE} [PayPal] Card {cc[-4:]}: {result} - {msg}"
-
-    async def async_bank_auth(self, card_str):
-        cc = card_str.split("|")[0]
-        await asyncio.sleep(random.uniform(0.2, 0.5))
-        result, msg = self.mock_bank_auth(cc)
-        return f"{MONEY_BANK} [Bank] Card {cc[-4:]}: {result} - {msg}"
-
     def mock_basic_auth(self, cc):
-        try:
-            return ("APPROVED", "Basic auth passed") if int(cc[-1]) % 2 == 0 else ("DECLINED", "Basic auth declined")
-        except:
-            return ("ERROR", "Invalid card number")
+        return ("APPROVED", "Basic auth passed") if int(cc[-1]) % 2 == 0 else ("DECLINED", "Basic auth declined")
 
-    def mock_b3_auth(self, cc):
-        try:
-            s = sum(int(d) for d in cc if d.isdigit())
-            return ("3DS AUTHORIZED", "3D Secure passed") if s % 3 == 0 else ("3DS FAILED", "3D Secure failed")
-        except:
-            return ("ERROR", "Invalid card number")
+    def mock_b3_auth(self, digit_sum):
+        return ("3DS AUTHORIZED", "3D Secure passed") if digit_sum % 3 == 0 else ("3DS FAILED", "3D Secure failed")
 
     def mock_stripe_auth(self, cc):
-        try:
-            return ("Stripe AUTHORIZED", "Stripe payment accepted") if int(cc[-2]) % 2 == 1 else ("Stripe DECLINED", "Stripe payment declined")
-        except:
-            return ("ERROR", "Invalid card number")
-
-    def mock_paypal_auth(self, cc):
-        try:
-            return ("PayPal AUTHORIZED", "PayPal payment accepted") if random.random() > 0.4 else ("PayPal DECLINED", "PayPal payment declined")
-        except:
-            return ("ERROR", "Invalid card number")
-
-    def mock_bank_auth(self, cc):
-        try:
-            s = sum(int(d) for d in cc if d.isdigit())
-            return ("Bank DECLINED", "Bank declined transaction") if s % 7 == 0 else ("Bank APPROVED", "Bank approved transaction")
-        except:
-            return ("ERROR", "Invalid card number")
-
-    async def autodel_message(self, context, msg, delay_sec):
-        await asyncio.sleep(delay_sec)
-        try:
-            await context.bot.delete_message(chat_id=msg.chat_id, message_id=msg.message_id)
-        except Exception as e:
-            logger.debug(f"Delete message failed: {e}")
+        return ("Stripe AUTHORIZED", "Stripe payment accepted") if int(cc[-2]) % 2 == 1 else ("Stripe DECLINED", "Stripe payment declined")
+
+    def mock_paypal_auth(self):
+        return ("PayPal AUTHORIZED", "PayPal payment accepted") if random.random() > 0.4 else ("PayPal DECLINED", "PayPal payment declined")
+
+    def mock_bank_auth(self, digit_sum):
+        return ("Bank DECLINED", "Bank declined transaction") if digit_sum % 7 == 0 else ("Bank APPROVED", "Bank approved transaction")
+
+    def autodel_message(self, msg, delay_sec):
+        heapq.heappush(self._delqueue, (time.monotonic() + delay_sec, msg.chat_id, msg.message_id))
+        self._wakeup.set()
+
+    async def start_sweeper(self, tg_bot):
+        self._sweeper = asyncio.create_task(self._sweep(tg_bot))
+
+    async def _sweep(self, tg_bot):
+        while True:
+            if self._delqueue:
+                delay = self._delqueue[0][0] - time.monotonic()
+                if delay <= 0:
+                    _, chat_id, message_id = heapq.heappop(self._delqueue)
+                    try:
+                        await tg_bot.delete_message(chat_id=chat_id, message_id=message_id)
+                    except Exception as e:
+                        logger.debug(f"Delete message failed: {e}")
+                    continue
+            else:
+                delay = None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
 
     async def help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(
             f"{STAR} *CC Checker Bot Help*\n"
             f"/gen - Generate random real CC (separate box for each)\n"
-            f"/gen N - Generate N random (N messages)\n"
+            f"/gen N - Generate N random (one message)\n"
             f"/gen <bin> - Generate for that BIN\n"
             f"/gen <bin> N - Generate N for that BIN\n"
             f"/chk <cc|mm|yy|cvv> - Check a single card (shows type/emoji)\n"
@@ -420,10 +537,19 @@ class TelegramCCCheckerBot:
             parse_mode="MarkdownV2"
         )
 
-async def main():
+def main():
     defaults = Defaults(parse_mode="MarkdownV2")
     bot = TelegramCCCheckerBot()
-    application = ApplicationBuilder().token(BOT_TOKEN).defaults(defaults).build()
+    builder = (
+        ApplicationBuilder()
+        .token(BOT_TOKEN)
+        .defaults(defaults)
+        .post_init(lambda app: bot.start_sweeper(app.bot))
+        .post_shutdown(lambda _: bot.aclose())
+    )
+    if aiolimiter is not None:
+        builder = builder.rate_limiter(ReplyRateLimiter(max_retries=3))
+    application = builder.build()
 
     application.add_handler(CommandHandler("gen", bot.gen))
     application.add_handler(CommandHandler("chk", bot.chk))
@@ -433,7 +559,9 @@ async def main():
     application.add_handler(CommandHandler("help", bot.help))
 
     logger.info("🚀 Telegram CC Checker Bot started!")
-    await application.run_polling()
+    application.run_polling()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        asyncio.set_event_loop(uvloop.new_event_loop())
+    main()